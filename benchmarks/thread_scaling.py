@@ -0,0 +1,65 @@
+"""Measure how parsing throughput scales with threads.
+
+Run from the repository root:
+
+    python benchmarks/thread_scaling.py --threads 1 2 4 8 16 32
+
+Each thread parses the same number of statements, once with a shared
+marcholdings.parser.Parser and once with plain parse_holdings. On a build
+with the GIL throughput stays flat; on a free-threaded build it should grow
+with the number of threads up to the number of cores.
+"""
+
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+import os
+import random
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+
+from marcholdings import parse_holdings  # noqa: E402
+from marcholdings.parser import Parser  # noqa: E402
+from marcholdings.test.generators import random_gap_statement  # noqa: E402
+
+
+def run(function, statements, threads, per_thread):
+    """Statements parsed per second by `threads` threads."""
+    barrier = threading.Barrier(threads)
+
+    def work(offset):
+        barrier.wait()
+        count = len(statements)
+        for i in range(per_thread):
+            function(statements[(offset + i) % count])
+
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        start = time.perf_counter()
+        list(pool.map(work, range(0, threads * 997, 997)))
+        elapsed = time.perf_counter() - start
+    return threads * per_thread / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8, 16, 32])
+    parser.add_argument("--per-thread", type=int, default=20000)
+    parser.add_argument("--statements", type=int, default=1000)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    statements = [random_gap_statement(rng) for _ in range(args.statements)]
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print("Python %s, GIL %s" % (sys.version.split()[0], "on" if gil else "off"))
+    print("%8s %16s %16s" % ("threads", "Parser/s", "parse_holdings/s"))
+    for threads in args.threads:
+        shared = Parser()
+        cached = run(shared.parse_holdings, statements, threads, args.per_thread)
+        plain = run(parse_holdings, statements, threads, args.per_thread // 10)
+        print("%8d %16.0f %16.0f" % (threads, cached, plain))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,34 @@
 """parse Z39.71 textual holdings"""
-from marcholdings.holding import Holding, parse_holdings
+from marcholdings.cache import HoldingsCache
+from marcholdings.gaps import PublicationPattern, find_gaps
+from marcholdings.holding import (
+    Holding,
+    normalize_holdings,
+    normalize_many,
+    parse_holdings,
+)
+from marcholdings.parser import Parser
+from marcholdings.patterns import CaptionPattern, decode_record, decode_records
+from marcholdings.resolver import Resolver, ResolverRegistry
+from marcholdings.validate import Diagnostic, parse_valid, validate_holdings
 from marcholdings.version import __version__
 
-__all__ = ["__version__", "Holding", "parse_holdings"]
+__all__ = [
+    "__version__",
+    "CaptionPattern",
+    "Diagnostic",
+    "Holding",
+    "HoldingsCache",
+    "Parser",
+    "PublicationPattern",
+    "Resolver",
+    "ResolverRegistry",
+    "decode_record",
+    "decode_records",
+    "find_gaps",
+    "normalize_holdings",
+    "normalize_many",
+    "parse_holdings",
+    "parse_valid",
+    "validate_holdings",
+]
@@ -0,0 +1,234 @@
+"""Disk-backed cache of parsed holdings statements"""
+
+import datetime
+import hashlib
+import json
+import threading
+
+from marcholdings.helpers import caption_table
+from marcholdings.holding import Holding, parse_holdings
+from marcholdings.version import __version__
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS holdings (
+    version TEXT NOT NULL,
+    captions TEXT NOT NULL,
+    statement TEXT NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (version, captions, statement)
+) WITHOUT ROWID
+"""
+
+
+class HoldingsCache(object):
+    """SQLite-backed cache of ``parse_holdings`` results.
+
+    Entries are keyed by the statement text, by a digest of the caption
+    table it was parsed with, and by a version string, which defaults to the
+    installed marcholdings version, so upgrading the library or registering
+    a caption makes old entries invisible. Each thread gets its own
+    connection.
+
+    The default rollback journal works for a cache on a filesystem shared
+    between hosts, where any number of processes may read between writes.
+    When every process is on the same host, ``journal_mode="wal"`` lets
+    readers carry on while one process writes.
+
+    The standard library's :mod:`sqlite3` is imported when the first
+    connection is opened, so builds of Python without it can use the rest
+    of marcholdings.
+
+    Args:
+        path (str): path of the SQLite database file
+        version (str): version entries are stored and looked up under
+        journal_mode (str): SQLite journal mode to use
+        timeout (float): seconds to wait for the write lock
+        captions (Optional[frozenset]): caption table from
+            :func:`marcholdings.helpers.caption_table` to parse with; defaults
+            to the registered captions at the time of each call
+
+    """
+
+    def __init__(
+        self,
+        path,
+        version=__version__,
+        journal_mode="delete",
+        timeout=30.0,
+        captions=None,
+    ):
+        self.path = path
+        self.version = version
+        self.journal_mode = journal_mode
+        self.timeout = timeout
+        self.captions = captions
+        self._digest = (None, "")
+        self._local = threading.local()
+        self._connection().execute(_SCHEMA)
+
+    def _connection(self):
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            import sqlite3
+
+            connection = sqlite3.connect(self.path, timeout=self.timeout)
+            connection.execute("PRAGMA journal_mode=%s" % self.journal_mode)
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+        return connection
+
+    def _table(self):
+        """The caption table to parse with, and its digest."""
+        table = caption_table() if self.captions is None else self.captions
+        digested, digest = self._digest
+        if table is not digested:
+            text = "\n".join(sorted(table)).encode("utf-8")
+            digest = hashlib.sha1(text).hexdigest()
+            self._digest = (table, digest)
+        return table, digest
+
+    def get(self, text_holdings):
+        """Look up a cached statement.
+
+        Args:
+            text_holdings (str): textual holdings
+
+        Returns:
+            Optional[List[Holding]]: cached holdings, or None on a miss
+        """
+        return self._get(text_holdings, self._table()[1])
+
+    def _get(self, text_holdings, digest):
+        row = (
+            self._connection()
+            .execute(
+                "SELECT data FROM holdings"
+                " WHERE version = ? AND captions = ? AND statement = ?",
+                (self.version, digest, text_holdings),
+            )
+            .fetchone()
+        )
+        if row is None:
+            return None
+        return _loads(row[0])
+
+    def set(self, text_holdings, holdings):
+        """Store parsed holdings for a statement.
+
+        Args:
+            text_holdings (str): textual holdings
+            holdings (List[Holding]): parsed holdings
+        """
+        self.set_many([(text_holdings, holdings)])
+
+    def set_many(self, items):
+        """Store several parsed statements in a single transaction.
+
+        Args:
+            items (Iterable[Tuple[str, List[Holding]]]): statements and
+                their parsed holdings
+        """
+        self._set_many(items, self._table()[1])
+
+    def _set_many(self, items, digest):
+        connection = self._connection()
+        with connection:
+            connection.executemany(
+                "INSERT OR REPLACE INTO holdings VALUES (?, ?, ?, ?)",
+                (
+                    (self.version, digest, text, _dumps(holdings))
+                    for text, holdings in items
+                ),
+            )
+
+    def parse_holdings(self, text_holdings):
+        """Parse a holdings statement, using the cache when possible.
+
+        Args:
+            text_holdings (str): textual holdings
+
+        Returns:
+            List[Holding]: non-gap holdings objects
+        """
+        return self.parse_many([text_holdings])[0]
+
+    def parse_many(self, statements):
+        """Parse several holdings statements, using the cache when possible.
+
+        Misses are parsed and written back in one transaction.
+
+        Args:
+            statements (Iterable[str]): textual holdings
+
+        Returns:
+            List[List[Holding]]: parsed holdings, one list per statement
+        """
+        table, digest = self._table()
+        results = []
+        misses = []
+        for text in statements:
+            holdings = self._get(text, digest)
+            if holdings is None:
+                holdings = parse_holdings(text, table)
+                misses.append((text, holdings))
+            results.append(holdings)
+        if misses:
+            self._set_many(misses, digest)
+        return results
+
+    def prune(self):
+        """Delete entries stored under other versions.
+
+        Returns:
+            int: number of entries deleted
+        """
+        connection = self._connection()
+        with connection:
+            cursor = connection.execute(
+                "DELETE FROM holdings WHERE version != ?", (self.version,)
+            )
+        return cursor.rowcount
+
+    def close(self):
+        """Close this thread's connection to the cache."""
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+
+
+def _dumps(holdings):
+    """Serialize holdings to compact JSON, with dates as ordinals."""
+    return json.dumps(
+        [
+            [
+                h.start_date.toordinal() if h.start_date else None,
+                h.end_date.toordinal() if h.end_date else None,
+                h.start_volume,
+                h.start_issue,
+                h.end_volume,
+                h.end_issue,
+            ]
+            for h in holdings
+        ],
+        separators=(",", ":"),
+    )
+
+
+def _loads(data):
+    """Deserialize holdings serialized by _dumps."""
+    holdings = []
+    for start, end, start_volume, start_issue, end_volume, end_issue in json.loads(
+        data
+    ):
+        holdings.append(
+            Holding(
+                datetime.date.fromordinal(start) if start else None,
+                datetime.date.fromordinal(end) if end else None,
+                start_volume,
+                start_issue,
+                end_volume,
+                end_issue,
+            )
+        )
+    return holdings
@@ -1,3 +1,5 @@
+import re
+
 MONTHS = [
     None,
     "Jan.",
@@ -13,3 +15,26 @@ MONTHS = [
     "Nov.",
     "Dec.",
 ]
+
+CAPTIONS = [
+    "v.",
+    "no.",
+    "pt.",
+    "ser.",
+    "bd.",
+    "t.",
+    "jahrg.",
+    "h.",
+    "heft",
+    "tome",
+    "vol.",
+    "anno",
+    "année",
+    "nr.",
+    "iss.",
+    "suppl.",
+]
+
+# separator between parts that each carry their own chronology, as in
+# "v.1-10(1970-1979); v.12(1981)-"; the separator itself is captured
+SEGMENT_SPLIT = re.compile(r"(?<=\))\s*([,;])\s*")
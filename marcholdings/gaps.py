@@ -0,0 +1,138 @@
+"""Find missing issues by comparing holdings to a publication pattern"""
+
+from collections import namedtuple
+import calendar
+import datetime
+
+from marcholdings.helpers import leading_number
+from marcholdings.holding import Holding
+
+PublicationPattern = namedtuple(
+    "PublicationPattern",
+    ["frequency", "start_year", "issues_per_volume", "start_volume"],
+    defaults=(None, 1),
+)
+PublicationPattern.__doc__ = """How a title is published.
+
+Args:
+    frequency (int): issues per year, e.g. 12 for monthly, 365 for daily
+    start_year (int): year of the first issue
+    issues_per_volume (Optional[int]): issues in each volume, or None for
+        titles identified by date only
+    start_volume (int): number of the first volume
+"""
+
+
+def find_gaps(holdings, pattern, end_year=None):
+    """Find the issues of a run that are not held.
+
+    Holdings and the expected run are both handled as ranges of issue
+    numbers counted from the first issue, so the work depends on the number
+    of holdings rather than the number of issues. Holdings with a numbered
+    volume are placed by enumeration, others by date; a holding that can be
+    placed by neither, such as "v.1-5" on a pattern without
+    ``issues_per_volume``, raises ValueError rather than counting as a gap.
+
+    Args:
+        holdings (Iterable[Holding]): parsed holdings of the title
+        pattern (PublicationPattern): publication pattern of the title
+        end_year (Optional[int]): last year expected; defaults to this year
+
+    Returns:
+        List[Holding]: the missing ranges, in order
+    """
+    if end_year is None:
+        end_year = datetime.date.today().year
+    total = (end_year - pattern.start_year + 1) * pattern.frequency
+    held = []
+    for holding in holdings:
+        span = _issue_span(holding, pattern, total)
+        if span[0] <= span[1]:
+            held.append(span)
+
+    gaps = []
+    expected = 0
+    for start, end in sorted(held):
+        if start > expected:
+            gaps.append(_gap_holding(expected, start - 1, pattern))
+        expected = max(expected, end + 1)
+    if expected < total:
+        gaps.append(_gap_holding(expected, total - 1, pattern))
+    return gaps
+
+
+def _issue_span(holding, pattern, total):
+    """Range of issue numbers covered by a holding, clamped to the run."""
+    last = total - 1
+    open_ended = not any((holding.end_date, holding.end_volume, holding.end_issue))
+    start_volume = leading_number(holding.start_volume or "")
+    if pattern.issues_per_volume and start_volume is not None:
+        start = _enum_index(start_volume, holding.start_issue, 1, pattern)
+        if open_ended:
+            end = last
+        else:
+            end_volume = leading_number(holding.end_volume or "")
+            if end_volume is None:
+                end_volume = start_volume
+            end = _enum_index(
+                end_volume, holding.end_issue, pattern.issues_per_volume, pattern
+            )
+    elif holding.start_date:
+        start = _date_index(holding.start_date, pattern)
+        end = _date_index(holding.end_date, pattern) if holding.end_date else last
+    else:
+        raise ValueError("Holding not placeable on the pattern: %s" % holding)
+    return max(start, 0), min(end, last)
+
+
+def _enum_index(volume, issue, default_issue, pattern):
+    """Issue number of a volume and issue within the run."""
+    number = leading_number(issue or "")
+    if number is None:
+        number = default_issue
+    return (volume - pattern.start_volume) * pattern.issues_per_volume + number - 1
+
+
+def _date_index(date, pattern):
+    """Issue number of the issue published on a date."""
+    frequency = pattern.frequency
+    if 12 % frequency == 0:
+        within = (date.month - 1) * frequency // 12
+    else:
+        days = 366 if calendar.isleap(date.year) else 365
+        within = (date.timetuple().tm_yday - 1) * frequency // days
+    return (date.year - pattern.start_year) * frequency + within
+
+
+def _issue_date(index, pattern):
+    """Date the issue with the given number begins."""
+    year, within = divmod(index, pattern.frequency)
+    year += pattern.start_year
+    if 12 % pattern.frequency == 0:
+        return datetime.date(year, within * 12 // pattern.frequency + 1, 1)
+    days = 366 if calendar.isleap(year) else 365
+    offset = -(-within * days // pattern.frequency)
+    return datetime.date(year, 1, 1) + datetime.timedelta(days=offset)
+
+
+def _gap_holding(start, end, pattern):
+    """Holding describing the issues numbered start to end."""
+    start_date = _issue_date(start, pattern)
+    end_date = _issue_date(end + 1, pattern) - datetime.timedelta(days=1)
+    per_volume = pattern.issues_per_volume
+    if not per_volume:
+        return Holding(start_date, end_date)
+    start_volume, start_issue = divmod(start, per_volume)
+    end_volume, end_issue = divmod(end, per_volume)
+    if start_issue == 0 and end_issue == per_volume - 1:
+        start_issue = end_issue = ""
+    else:
+        start_issue, end_issue = str(start_issue + 1), str(end_issue + 1)
+    return Holding(
+        start_date,
+        end_date,
+        str(start_volume + pattern.start_volume),
+        start_issue,
+        str(end_volume + pattern.start_volume),
+        end_issue,
+    )
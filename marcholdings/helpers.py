@@ -1,31 +1,133 @@
 """helper functions for marcholdings"""
 from collections import namedtuple
+import functools
 import re
+import threading
+
+from marcholdings.constants import CAPTIONS
 
 SplitEnum = namedtuple("SplitEnum", ["caption", "enumeration"])
 
+ORDINAL_SUFFIXES = ("st", "nd", "rd", "th")
+
+# lowercased known captions. The set is replaced rather than mutated by
+# register_caption, so lookups never see a partial update and need no lock;
+# only writers take _caption_lock.
+_caption_table = frozenset()
+_caption_lock = threading.Lock()
+
+# the text a caption could be: everything up to the first space, digit or
+# dot, and the dot itself
+_CAPTION_PREFIX = re.compile(r"[^ .0-9]*\.?")
+
+_EMPTY = SplitEnum("", "")
+
+# builds a SplitEnum from a (caption, enumeration) tuple in C, skipping the
+# namedtuple's Python-level __new__
+_split = functools.partial(tuple.__new__, SplitEnum)
+
+# characters a caption stops at
+_CAPTION_END = frozenset(" .0123456789")
+
+
+def register_caption(caption):
+    """register a caption so split_enum recognizes it
+
+    Captions ending in "." may be followed directly by the enumeration
+    ("v.1"); word captions must be followed by a space or a digit
+    ("Heft 3"). Matching is case-insensitive.
+
+    :param caption: the caption text, e.g. "jahrg." or "Heft"
+    """
+    global _caption_table
+    key = _caption_key(caption)
+    with _caption_lock:
+        _caption_table = _caption_table | {key}
+
+
+def _caption_key(caption):
+    """lowercase a caption, checking that split_enum can match it"""
+    key = caption.strip().lower()
+    if not key or _CAPTION_PREFIX.match(key).group() != key:
+        raise ValueError("Bad caption: %r" % caption)
+    return key
+
+
+def caption_table(captions=(), table=None):
+    """build a caption table to pass to split_enum
+
+    :param captions: captions to add, as accepted by register_caption
+    :param table: the table to extend; defaults to the registered captions
+    """
+    if table is None:
+        table = _caption_table
+    if not captions:
+        return table
+    return table.union(_caption_key(caption) for caption in captions)
+
+
+for _caption in CAPTIONS:
+    register_caption(_caption)
+
 
-def split_whole_enum(enumeration):
-    """split a whole enum into volume and issue."""
+def split_whole_enum(enumeration, captions=None):
+    """split a whole enum into volume and issue.
+
+    :param enumeration: the textual enumeration to be split
+    :param captions: caption table from caption_table; defaults to the
+        registered captions
+    """
     vol, _, iss = enumeration.partition(":")
-    return tuple(split_enum(x).enumeration for x in (vol, iss))
+    return tuple(split_enum(x, captions).enumeration for x in (vol, iss))
 
 
-def split_enum(enumeration):
+def split_enum(enumeration, captions=None):
     """split a textual enumeration into its caption and enumeration parts
 
     :param enumeration: the textual enumeration to be split
+    :param captions: caption table from caption_table; defaults to the
+        registered captions
     """
+    if not enumeration:
+        return _EMPTY
+    if captions is None:
+        captions = _caption_table
+    # every key in the table is a caption split_enum can match, so each
+    # candidate below only needs the one lookup
+    dot = enumeration.find(".") + 1
+    if dot and enumeration[:dot].lower() in captions:
+        rest = enumeration[dot:]
+        if rest[:1] == " ":
+            rest = rest.lstrip(" ")
+        return _split((enumeration[:dot], rest))
+    if "0" <= enumeration[0] <= "9":
+        # an ordinal before its caption, e.g. "2nd ser."
+        number, space, caption = enumeration.partition(" ")
+        if not space:
+            if not dot:
+                return _split(("", enumeration))
+        elif caption.lower() in captions:
+            return _split((caption, trim_ordinal(number)))
+    else:
+        # a word caption must be followed by something: a space or a digit
+        word, space, rest = enumeration.partition(" ")
+        if space and word.lower() in captions:
+            return _split((word, rest.lstrip(" ")))
+        end = 0
+        while end < len(word) and word[end] not in _CAPTION_END:
+            end += 1
+        if end < len(word) and word[end] != "." and word[:end].lower() in captions:
+            return _split((word[:end], enumeration[end:]))
     parts = ["", enumeration]
     if "." in enumeration[1:-1]:
         parts = enumeration.split(".", 1)
         parts[0] += "."
     elif " " in enumeration:
         parts = enumeration.split(" ", 1)
-        if parts[0][0].isdigit():
+        if parts[0][:1].isdigit():
             parts.reverse()
             parts[1] = trim_ordinal(parts[1])
-    return SplitEnum(*parts)
+    return _split(parts)
 
 
 def trim_ordinal(ordinal):
@@ -33,4 +135,34 @@ def trim_ordinal(ordinal):
 
     :param ordinal: ordinal number to trim
     """
-    return re.sub(r"(st|nd|rd|th)$", "", ordinal)
+    if ordinal.endswith(ORDINAL_SUFFIXES):
+        return ordinal[:-2]
+    return ordinal
+
+
+def leading_number(enumeration):
+    """return the number an enumeration starts with, or None
+
+    :param enumeration: enumeration text, e.g. "12" or "1A"
+    """
+    end = 0
+    while end < len(enumeration) and "0" <= enumeration[end] <= "9":
+        end += 1
+    return int(enumeration[:end]) if end else None
+
+
+def enum_sort_key(enumeration):
+    """build a sort key for an enumeration
+
+    Numbered enumerations sort numerically and before unnumbered ones;
+    missing enumerations sort last.
+
+    :param enumeration: enumeration text, possibly empty or None
+    """
+    if not enumeration:
+        return (2, 0, "")
+    text = enumeration.strip().lower()
+    number = leading_number(text)
+    if number is None:
+        return (1, 0, text)
+    return (0, number, text.lstrip("0123456789"))
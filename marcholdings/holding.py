@@ -3,15 +3,21 @@
 import calendar
 from collections import deque
 import datetime
+import functools
+import math
 import re
 
-from marcholdings.helpers import split_whole_enum
-from marcholdings.constants import MONTHS
+from marcholdings.helpers import caption_table, enum_sort_key, split_whole_enum
+from marcholdings.constants import MONTHS, SEGMENT_SPLIT
+
+NORMALIZE_CACHE_SIZE = 65536
 
 
 class Holding(object):
     """Holdings information from a MARC record
 
+    Holdings compare, sort and hash by :attr:`sort_key`.
+
     Args:
         start_date (datetime.date): date holdings begin.
         end_date (Optional[datetime.date]): date holdings end.
@@ -34,12 +40,75 @@ class Holding(object):
         self.start_issue = start_issue
         self.end_issue = end_issue
 
+    @property
+    def sort_key(self):
+        """tuple: key that orders holdings by start, then end.
+
+        Dates come first, then volume and issue; enumerations compare by
+        their leading number. Missing values, including open ends, sort last.
+        Ties are broken by the enumeration text itself, so holdings are
+        only equal when they print the same.
+
+        The key is computed on first use and cached, so do not change a
+        Holding's attributes once it has been compared, sorted or hashed.
+        ``sorted(holdings)`` calls :meth:`__lt__` in Python for every
+        comparison; ``sorted(holdings, key=operator.attrgetter("sort_key"))``
+        compares the keys in C and is several times faster.
+        """
+        try:
+            return self._sort_key
+        except AttributeError:
+            self._sort_key = (
+                self.start_date.toordinal() if self.start_date else math.inf,
+                enum_sort_key(self.start_volume),
+                enum_sort_key(self.start_issue),
+                self.end_date.toordinal() if self.end_date else math.inf,
+                enum_sort_key(self.end_volume),
+                enum_sort_key(self.end_issue),
+                self.start_volume or "",
+                self.start_issue or "",
+                self.end_volume or "",
+                self.end_issue or "",
+            )
+            return self._sort_key
+
+    def __eq__(self, other):
+        if not isinstance(other, Holding):
+            return NotImplemented
+        return self.sort_key == other.sort_key
+
+    def __lt__(self, other):
+        if not isinstance(other, Holding):
+            return NotImplemented
+        return self.sort_key < other.sort_key
+
+    def __le__(self, other):
+        if not isinstance(other, Holding):
+            return NotImplemented
+        return self.sort_key <= other.sort_key
+
+    def __gt__(self, other):
+        if not isinstance(other, Holding):
+            return NotImplemented
+        return self.sort_key > other.sort_key
+
+    def __ge__(self, other):
+        if not isinstance(other, Holding):
+            return NotImplemented
+        return self.sort_key >= other.sort_key
+
+    def __hash__(self):
+        return hash(self.sort_key)
+
     @classmethod
-    def from_text(cls, text_holding):
+    def from_text(cls, text_holding, captions=None):
         """Create a Holding from Z39.71 non-gap text holding
 
         Args:
             text_holding (str): text of a non-gap holding
+            captions (frozenset): caption table from
+                :func:`marcholdings.helpers.caption_table`; defaults to the
+                registered captions
 
         Returns:
             Holding: a Holding object
@@ -51,6 +120,13 @@ class Holding(object):
         elif "(" in text_holding:
             date_part = text_holding.split("(")[1].split(")")[0]
         if text_holding.endswith("-"):
+            # a gap statement passed whole is parsed as loosely as before
+            if (
+                "," not in text_holding
+                and ";" not in text_holding
+                and _closed_before_open(text_holding)
+            ):
+                raise ValueError("Closed range before open end: %s" % text_holding)
             end_date = None
             if date_part:
                 start_date = parse_date(date_part.rstrip("-"))
@@ -79,7 +155,7 @@ class Holding(object):
         elif not text_holding[0:4].isdigit():
             enum_part = text_holding
         start_enum, separator, end_enum = enum_part.partition("-")
-        start_volume, start_issue = split_whole_enum(start_enum)
+        start_volume, start_issue = split_whole_enum(start_enum, captions)
         if "-" not in text_holding:
             end_volume, end_issue = start_volume, start_issue
         elif (
@@ -88,7 +164,7 @@ class Holding(object):
             end_volume = start_volume
             end_issue = end_enum
         else:
-            end_volume, end_issue = split_whole_enum(end_enum)
+            end_volume, end_issue = split_whole_enum(end_enum, captions)
 
         return cls(
             start_date, end_date, start_volume, start_issue, end_volume, end_issue
@@ -105,7 +181,9 @@ class Holding(object):
         if self.start_issue:
             parts.append("no.")
             parts.append(self.start_issue)
-        if (self.end_volume and self.end_volume != self.start_volume) or self.end_issue:
+        if (self.end_volume and self.end_volume != self.start_volume) or (
+            self.end_issue and self.end_issue != self.start_issue
+        ):
             parts.append("-")
             if self.end_volume and self.end_volume != self.start_volume:
                 if ":" in parts:
@@ -121,14 +199,36 @@ class Holding(object):
         if has_enum and self.start_date:
             parts.append("(")
         if self.start_date:
-            parts.append(str(self.start_date.year))
-            if self.start_date.month > 1:
-                parts.append(f":{MONTHS[self.start_date.month]}")
-            if self.end_date and self.end_date.year != self.start_date.year:
+            start, end = self.start_date, self.end_date
+            same_year = bool(end) and end.year == start.year
+            # days are written only when a range does not cover whole months
+            start_day = start.day != 1
+            end_day = bool(end) and (
+                end.day != calendar.monthrange(end.year, end.month)[1]
+            )
+            whole_year = (
+                same_year
+                and start.month == 1
+                and end.month == 12
+                and not (start_day or end_day)
+            )
+            parts.append(str(start.year))
+            if start.month > 1 or start_day or (same_year and not whole_year):
+                parts.append(f":{MONTHS[start.month]}")
+                if start_day:
+                    parts.append(f" {start.day}")
+            if end and not same_year:
                 parts.append("-")
-                parts.append(str(self.end_date.year))
-                if self.end_date.month < 12:
-                    parts.append(f":{MONTHS[self.end_date.month]}")
+                parts.append(str(end.year))
+                if end.month < 12 or end_day:
+                    parts.append(f":{MONTHS[end.month]}")
+                if end_day:
+                    parts.append(f" {end.day}")
+            elif same_year and not whole_year and end != start:
+                if end.month != start.month or start_day or end_day:
+                    parts.append(f"-{MONTHS[end.month]}")
+                    if end_day:
+                        parts.append(f" {end.day}")
 
         if has_enum and self.start_date:
             parts.append(")")
@@ -164,7 +264,7 @@ def parse_date(date_string, end=False):
         except ValueError:
             try:
                 month = season_to_month(month_text, end)
-            except ValueError:
+            except KeyError:
                 raise ValueError("Bad month/season: %s" % month_text)
     elif end:
         month = 12
@@ -178,6 +278,21 @@ def parse_date(date_string, end=False):
     return datetime.date(year, month, day)
 
 
+def _closed_before_open(text_holding):
+    """Whether an open-ended holding also gives an end, as in "v.3-4(1992-1993)-"
+
+    Args:
+        text_holding (str): text of a non-gap holding ending in "-"
+
+    Returns:
+        bool: True if the enumeration or chronology holds a closed range
+    """
+    enum_part, _, date_part = text_holding.rstrip("-").partition("(")
+    if not date_part and enum_part[0:4].isdigit():
+        enum_part, date_part = "", enum_part
+    return "-" in enum_part or "-" in date_part
+
+
 def season_to_month(season_text, end):
     """Convert a season name to the correct month
 
@@ -198,7 +313,7 @@ def season_to_month(season_text, end):
     return seasons[season_text.lower()][end]
 
 
-def parse_holdings(text_holdings):
+def parse_holdings(text_holdings, captions=None):
     """Parse a holdings statement.
 
     Accepts a MARC holdings statement, possibly with gaps, and returns a list
@@ -206,11 +321,65 @@ def parse_holdings(text_holdings):
 
     Args:
         text_holdings (str): textual holdings
+        captions (frozenset): caption table from
+            :func:`marcholdings.helpers.caption_table`; defaults to the
+            registered captions
 
     Returns:
         List[Holding]: non-gap holdings objects
     """
-    return [Holding.from_text(th) for th in _comma_split(text_holdings)]
+    return [Holding.from_text(th, captions) for th in _comma_split(text_holdings)]
+
+
+def normalize_holdings(text_holdings, captions=None):
+    """Rewrite a holdings statement in canonical Z39.71 form.
+
+    Each part is parsed and rendered with :meth:`Holding.__str__`, and the
+    parts are rejoined with the commas and semicolons of the original
+    statement, so a statement seen for the first time costs as much as
+    parsing it. Results are memoized per statement and caption table, which
+    is what makes normalizing repetitive data cheap; use
+    ``normalize_holdings.cache_clear()`` to empty the memo.
+
+    Args:
+        text_holdings (str): textual holdings
+        captions (frozenset): caption table from
+            :func:`marcholdings.helpers.caption_table`; defaults to the
+            registered captions
+
+    Returns:
+        str: canonical textual holdings
+    """
+    if captions is None:
+        captions = caption_table()
+    return _normalize(text_holdings, captions)
+
+
+@functools.lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def _normalize(text_holdings, captions):
+    parts, separators = _split_parts(text_holdings)
+    if not parts:
+        return ""
+    texts = [str(Holding.from_text(th, captions)) for th in parts]
+    return texts[0] + "".join(
+        separator + text for separator, text in zip(separators, texts[1:])
+    )
+
+
+normalize_holdings.cache_clear = _normalize.cache_clear
+
+
+def normalize_many(statements):
+    """Normalize a stream of holdings statements.
+
+    Args:
+        statements (Iterable[str]): textual holdings
+
+    Yields:
+        str: canonical textual holdings, in the order given
+    """
+    for statement in statements:
+        yield normalize_holdings(statement)
 
 
 def _comma_split(text_holdings):
@@ -222,6 +391,31 @@ def _comma_split(text_holdings):
     Returns:
         List[str]: holding text without commas, separated
     """
+    return _split_parts(text_holdings)[0]
+
+
+def _split_parts(text_holdings):
+    """Split a holding with commas into parts, keeping the separators.
+
+    Args:
+        text_holdings (str): textual holding
+
+    Returns:
+        Tuple[List[str], List[str]]: holding text without commas, and the
+        comma or semicolon that followed each part but the last
+    """
+    segments = SEGMENT_SPLIT.split(text_holdings)
+    if len(segments) > 1:
+        # each part carries its own chronology, e.g. "v.1(1990);v.3(1992)"
+        parts, separators = _split_parts(segments[0])
+        for separator, segment in zip(segments[1::2], segments[2::2]):
+            segment_parts, segment_separators = _split_parts(segment)
+            if parts and segment_parts:
+                separators.append(separator)
+            parts.extend(segment_parts)
+            separators.extend(segment_separators)
+        return parts, separators
+
     parts = []
     holding_open = text_holdings.endswith("-")
     paren_split = text_holdings.split("(")
@@ -236,19 +430,26 @@ def _comma_split(text_holdings):
             enums = paren_split[0]
             chrons = None
     enumlist = []
+    enum_separators = []
     if enums:
         esplit = deque(re.split("([ .,:;])", enums))
-        ec1 = "".join([esplit.popleft(), esplit.popleft()])
+        ec1 = ""
+        if len(esplit) > 1 and esplit[1] not in (",", ";"):
+            ec1 = esplit.popleft() + esplit.popleft()
         accum = ec1
         while esplit:
             accum += esplit.popleft()
-            if not esplit or esplit[0] in ",;":
+            if not esplit:
                 enumlist.append(accum)
-                accum = ec1
-                if esplit:
-                    esplit.popleft()
+            elif esplit[0] in (",", ";"):
+                # a space before the separator is not part of the enumeration
+                enumlist.append(accum.rstrip(" "))
+                enum_separators.append(esplit.popleft())
+                # later parts only inherit the caption if they lack their own
+                accum = ec1 if esplit and esplit[0][:1].isdigit() else ""
 
     chronlist = []
+    chron_separators = []
     if chrons:
         csplit = deque(re.split("([,:;])", chrons))
         caccum = ""
@@ -258,22 +459,32 @@ def _comma_split(text_holdings):
             caccum += token
             if token == ":":
                 deep = True
-            if not csplit or csplit[0] in ",;":
+            if not csplit or csplit[0] in (",", ";"):
                 chronlist.append(caccum)
-                if not deep or (csplit and csplit[1].isnumeric()):
+                if not deep or (len(csplit) > 1 and csplit[1].isnumeric()):
                     caccum = ""
                     deep = False
                 else:
                     caccum = caccum.split(":")[0] + ":"
                 if csplit:
-                    csplit.popleft()
+                    chron_separators.append(csplit.popleft())
+    if holding_open and chronlist and len(paren_split) > 1:
+        # "v.1,3(1990,1992-" is left open like "v.1,3(1990,1992)-"
+        chronlist[-1] = chronlist[-1].rstrip("-")
     if enumlist and chronlist:
+        if len(chronlist) != len(enumlist):
+            raise ValueError(
+                "Enumerations and chronologies differ in number: %s" % text_holdings
+            )
         for i, val in enumerate(enumlist):
             parts.append("%s(%s)" % (val, chronlist[i]))
+        separators = enum_separators
     elif chronlist:
         parts = chronlist
+        separators = chron_separators
     else:
         parts = enumlist
-    if holding_open:
+        separators = enum_separators
+    if holding_open and parts and not parts[-1].endswith("-"):
         parts[-1] += "-"
-    return parts
+    return parts, separators
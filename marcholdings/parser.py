@@ -0,0 +1,171 @@
+"""A memoizing holdings parser that can be shared between threads"""
+
+import threading
+import weakref
+
+from marcholdings.helpers import caption_table
+from marcholdings.holding import parse_holdings
+
+
+class Parser(object):
+    """Holdings parser with its own memo cache, counters and captions.
+
+    Every thread that uses the parser gets its own cache shard and counters,
+    so parsing takes no locks and threads never contend on shared state,
+    with or without the GIL. A shard belongs to its thread and is dropped
+    when the thread exits.
+
+    The parser starts with the captions registered in
+    :mod:`marcholdings.helpers` plus ``captions``; captions added later with
+    :meth:`register_caption` apply to this parser only. The table is
+    replaced rather than mutated, so parses read it without locking.
+
+    Cached Holding objects are returned to every caller in the same thread
+    that parses the same statement, so treat them as read-only.
+
+    Args:
+        maxsize (int): statements cached per thread before its shard is
+            emptied
+        captions (Iterable[str]): extra captions to recognize
+
+    """
+
+    def __init__(self, maxsize=65536, captions=()):
+        self.maxsize = maxsize
+        self.captions = caption_table(captions)
+        self._local = threading.local()
+        self._shards = weakref.WeakSet()
+        # an RLock, since a shard's finalizer may run wherever the garbage
+        # collector does, including inside this lock
+        self._shards_lock = threading.RLock()
+        self._generation = 0
+        # counters of the shards of exited threads
+        self._retired = _Counters(self._generation)
+
+    def _shard(self):
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = _Shard(self._generation)
+            self._local.shard = shard
+            with self._shards_lock:
+                self._shards.add(shard)
+            weakref.finalize(
+                shard, _retire, shard.counters, self._retired, self._shards_lock
+            )
+        elif shard.counters.generation != self._generation:
+            shard.reset(self._generation)
+        return shard
+
+    def register_caption(self, caption):
+        """Recognize a caption in statements parsed by this parser.
+
+        Earlier results are dropped, since they may have been parsed without
+        the caption.
+
+        Args:
+            caption (str): the caption text, e.g. "jahrg." or "Heft"
+        """
+        with self._shards_lock:
+            self.captions = caption_table([caption], self.captions)
+        self.clear()
+
+    def parse_holdings(self, text_holdings):
+        """Parse a holdings statement, reusing earlier results.
+
+        Args:
+            text_holdings (str): textual holdings
+
+        Returns:
+            List[Holding]: non-gap holdings objects
+        """
+        shard = self._shard()
+        holdings = shard.cache.get(text_holdings)
+        if holdings is None:
+            shard.counters.misses += 1
+            holdings = parse_holdings(text_holdings, self.captions)
+            if len(shard.cache) >= self.maxsize:
+                shard.cache.clear()
+            shard.cache[text_holdings] = holdings
+        else:
+            shard.counters.hits += 1
+        return list(holdings)
+
+    def parse_many(self, statements):
+        """Parse several holdings statements.
+
+        Args:
+            statements (Iterable[str]): textual holdings
+
+        Returns:
+            List[List[Holding]]: parsed holdings, one list per statement
+        """
+        return [self.parse_holdings(statement) for statement in statements]
+
+    def stats(self):
+        """Counters summed over all threads.
+
+        The sums are read without stopping other threads, so they may lag
+        behind parses still in progress. Threads that have exited keep their
+        hits and misses in the sums but no longer hold a cache.
+
+        Returns:
+            dict: ``hits``, ``misses``, ``cached`` and ``threads`` (threads
+            alive with a shard)
+        """
+        with self._shards_lock:
+            shards = list(self._shards)
+            retired = self._retired
+            hits, misses = retired.hits, retired.misses
+        current = [s for s in shards if s.counters.generation == self._generation]
+        return {
+            "hits": hits + sum(s.counters.hits for s in current),
+            "misses": misses + sum(s.counters.misses for s in current),
+            "cached": sum(len(s.cache) for s in current),
+            "threads": len(shards),
+        }
+
+    def clear(self):
+        """Empty the caches and counters of every thread.
+
+        Other threads drop their shard's contents the next time they parse.
+        """
+        with self._shards_lock:
+            self._generation += 1
+            self._retired.reset(self._generation)
+
+
+class _Shard(object):
+    """Cache and counters owned by one thread.
+
+    Only the owning thread holds a strong reference, through the parser's
+    thread-local storage; the parser tracks shards weakly, so a shard goes
+    away with its thread.
+    """
+
+    def __init__(self, generation):
+        self.counters = _Counters(generation)
+        self.cache = {}
+
+    def reset(self, generation):
+        self.counters.reset(generation)
+        self.cache = {}
+
+
+class _Counters(object):
+    """Hits and misses counted since the parser was last cleared."""
+
+    def __init__(self, generation):
+        self.reset(generation)
+
+    def reset(self, generation):
+        self.generation = generation
+        self.hits = 0
+        self.misses = 0
+
+
+def _retire(counters, retired, lock):
+    """Add the counters of an exited thread's shard to the parser's totals."""
+    with lock:
+        if counters.generation == retired.generation:
+            retired.hits += counters.hits
+            retired.misses += counters.misses
@@ -0,0 +1,216 @@
+"""Decode MARC 853/863 caption-and-pattern holdings"""
+
+import calendar
+from collections import namedtuple
+import datetime
+
+from marcholdings.holding import Holding, season_to_month
+
+ENUMERATION_CODES = "abcdef"
+CHRONOLOGY_CODES = "ijkl"
+
+# MARC 21 codes for seasons in chronology subfields
+SEASON_CODES = {"21": "spring", "22": "summer", "23": "autumn", "24": "winter"}
+
+Level = namedtuple("Level", ["code", "caption", "kind"])
+Level.__doc__ = """One level of a caption pattern.
+
+Args:
+    code (str): subfield code, e.g. "a"
+    caption (str): caption from the 853, e.g. "v." or "(year)"
+    kind (str): "volume", "issue", "year", "month", "season", "day", or
+        "other" for levels that do not map onto a Holding
+"""
+
+
+class CaptionPattern(object):
+    """A compiled 853 caption and pattern field.
+
+    The levels are classified once, so decoding each 863 that refers to the
+    pattern is a dictionary lookup per subfield.
+
+    Args:
+        link (str): link number from subfield $8
+        levels (List[Level]): captioned levels of the pattern
+
+    """
+
+    def __init__(self, link, levels):
+        self.link = link
+        self.levels = levels
+        self._kinds = {level.code: level.kind for level in levels}
+
+    @classmethod
+    def from_subfields(cls, subfields):
+        """Compile an 853 field.
+
+        Args:
+            subfields (Iterable[Tuple[str, str]]): (code, value) pairs, such
+                as the ``subfields`` of a pymarc field
+
+        Returns:
+            CaptionPattern: the compiled pattern
+        """
+        link = ""
+        levels = []
+        enumerations = 0
+        for code, value in subfields:
+            if code == "8":
+                link = value.split(".")[0]
+            elif code in ENUMERATION_CODES or code in CHRONOLOGY_CODES:
+                caption = value.strip()
+                chronological = caption.startswith("(") or code in CHRONOLOGY_CODES
+                if chronological:
+                    kind = caption.strip("()").lower()
+                    if kind not in ("year", "month", "season", "day"):
+                        kind = "other"
+                elif enumerations < 2:
+                    kind = ("volume", "issue")[enumerations]
+                    enumerations += 1
+                else:
+                    kind = "other"
+                levels.append(Level(code, caption, kind))
+        return cls(link, levels)
+
+    def decode(self, subfields):
+        """Decode an 863 field that uses this pattern.
+
+        Args:
+            subfields (Iterable[Tuple[str, str]]): (code, value) pairs
+
+        Returns:
+            Holding: the holding, as Holding.from_text would build it from
+            the equivalent textual statement
+        """
+        starts = {}
+        ends = {}
+        open_ended = False
+        for code, value in subfields:
+            kind = self._kinds.get(code)
+            if kind is None or kind == "other":
+                continue
+            start, dash, end = value.partition("-")
+            starts[kind] = start.strip()
+            if dash:
+                end = end.strip()
+                if end:
+                    ends[kind] = end
+                else:
+                    open_ended = True
+        has_dates = "year" in starts
+        start_date = _start_date(starts) if has_dates else None
+        if open_ended:
+            end_date = None
+            end_volume = end_issue = ""
+        else:
+            end_date = _end_date(starts, ends) if has_dates else None
+            end_volume = ends.get("volume", starts.get("volume", ""))
+            end_issue = ends.get("issue", starts.get("issue", ""))
+        return Holding(
+            start_date,
+            end_date,
+            starts.get("volume", ""),
+            starts.get("issue", ""),
+            end_volume,
+            end_issue,
+        )
+
+
+def decode_record(fields):
+    """Decode all 853/863 pairs of a record.
+
+    Each 853 is compiled once and used for every 863 that links to it.
+    863 fields are decoded in order of their link and sequence numbers;
+    those whose link has no 853 are skipped.
+
+    Args:
+        fields (Iterable[Tuple[str, Iterable[Tuple[str, str]]]]): (tag,
+            subfields) pairs; other tags are ignored
+
+    Returns:
+        List[Holding]: holdings described by the record
+    """
+    patterns = {}
+    items = []
+    for tag, subfields in fields:
+        if tag == "853":
+            pattern = CaptionPattern.from_subfields(subfields)
+            patterns[pattern.link] = pattern
+        elif tag == "863":
+            subfields = list(subfields)
+            link, sequence = _link_and_sequence(subfields)
+            items.append((link, sequence, len(items), subfields))
+    holdings = []
+    for link, _, _, subfields in sorted(items, key=_item_order):
+        pattern = patterns.get(link)
+        if pattern is not None:
+            holdings.append(pattern.decode(subfields))
+    return holdings
+
+
+def decode_records(records):
+    """Decode many records.
+
+    Args:
+        records (Iterable[Iterable[Tuple[str, Iterable[Tuple[str, str]]]]]):
+            records as accepted by :func:`decode_record`
+
+    Yields:
+        List[Holding]: holdings of each record, in order
+    """
+    for fields in records:
+        yield decode_record(fields)
+
+
+def _link_and_sequence(subfields):
+    """Link and sequence numbers from the $8 of an 863."""
+    for code, value in subfields:
+        if code == "8":
+            link, _, sequence = value.partition(".")
+            return link, sequence
+    return "", ""
+
+
+def _item_order(item):
+    link, sequence, position, _ = item
+    return (_as_int(link), _as_int(sequence), position)
+
+
+def _as_int(text):
+    return int(text) if text.isdigit() else 0
+
+
+def _month(text, end):
+    """Month number of a chronology value, which may be a season code."""
+    if text in SEASON_CODES:
+        return season_to_month(SEASON_CODES[text], end)
+    return int(text)
+
+
+def _first(text, end):
+    """One side of a value like "1990/1991" or "05/06"."""
+    if "/" in text:
+        return text.split("/")[1 if end else 0]
+    return text
+
+
+def _start_date(starts):
+    year = int(_first(starts["year"], False))
+    month_text = starts.get("month") or starts.get("season")
+    month = _month(_first(month_text, False), False) if month_text else 1
+    day = int(starts["day"]) if "day" in starts else 1
+    return datetime.date(year, month, day)
+
+
+def _end_date(starts, ends):
+    year_text = ends.get("year", starts["year"])
+    year = int(_first(year_text, True))
+    month_text = ends.get("month") or ends.get("season")
+    if month_text is None:
+        month_text = starts.get("month") or starts.get("season")
+    month = _month(_first(month_text, True), True) if month_text else 12
+    if "day" in ends or "day" in starts:
+        day = int(ends.get("day", starts.get("day")))
+    else:
+        day = calendar.monthrange(year, month)[1]
+    return datetime.date(year, month, day)
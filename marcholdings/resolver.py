@@ -0,0 +1,276 @@
+"""Answer coverage questions against a title's holdings"""
+
+from array import array
+from bisect import bisect_right
+from collections import OrderedDict
+import datetime
+import sys
+import threading
+
+from marcholdings.helpers import leading_number, split_enum
+from marcholdings.holding import parse_holdings
+
+_ISSUE_BITS = 32
+_ISSUE_MAX = (1 << _ISSUE_BITS) - 1
+_ENUM_OPEN = (1 << 64) - 1
+_DATE_OPEN = datetime.date.max.toordinal()
+
+
+class Resolver(object):
+    """Coverage of a single title, compiled for fast lookups.
+
+    The holdings statements are parsed once and reduced to two sorted sets
+    of disjoint ranges: one of date ordinals and one of (volume, issue)
+    positions packed into integers. Holdings whose volume is not numbered
+    only contribute to the date ranges. When some holdings give both a
+    volume and a date, their ranges are also kept in pairs, so that a
+    citation giving both is checked against a single holding.
+
+    Args:
+        statements (Union[str, Iterable[str]]): textual holdings of the title
+
+    """
+
+    __slots__ = ("_date_starts", "_date_ends", "_enum_starts", "_enum_ends", "_pairs")
+
+    def __init__(self, statements):
+        if isinstance(statements, str):
+            statements = [statements]
+        date_ranges = []
+        enum_ranges = []
+        pairs = []
+        paired = False
+        for statement in statements:
+            for holding in parse_holdings(statement):
+                date_range = None
+                if holding.start_date:
+                    end = holding.end_date.toordinal() if holding.end_date else None
+                    date_range = (holding.start_date.toordinal(), end or _DATE_OPEN)
+                    date_ranges.append(date_range)
+                enum_range = _enum_range(holding)
+                if enum_range:
+                    enum_ranges.append(enum_range)
+                paired = paired or bool(date_range and enum_range)
+                # an axis a holding does not give is not limited by it
+                pairs.append(
+                    (enum_range or (0, _ENUM_OPEN), date_range or (0, _DATE_OPEN))
+                )
+        self._date_starts, self._date_ends = _compile(date_ranges, "q")
+        self._enum_starts, self._enum_ends = _compile(enum_ranges, "Q")
+        self._pairs = _compile_pairs(pairs if paired else [])
+
+    @property
+    def nbytes(self):
+        """int: bytes used by the resolver and its compiled ranges."""
+        arrays = (
+            self._date_starts,
+            self._date_ends,
+            self._enum_starts,
+            self._enum_ends,
+        ) + self._pairs
+        return (
+            sys.getsizeof(self)
+            + sys.getsizeof(self._pairs)
+            + sum(sys.getsizeof(a) for a in arrays)
+        )
+
+    def covers(self, volume=None, issue=None, date=None):
+        """Check whether a citation falls within the holdings.
+
+        Each axis given in the citation is checked against the holdings that
+        describe that axis; an axis the holdings never mention is ignored.
+        A citation with both a volume and a date must be covered on both by
+        the same holding, where holdings give both. A volume without an
+        issue is covered if any part of it is held.
+
+        Args:
+            volume (Union[int, str, None]): volume number
+            issue (Union[int, str, None]): issue number within the volume
+            date (Union[datetime.date, int, None]): date, or a year
+
+        Returns:
+            bool: True if the citation is covered on every axis checked
+        """
+        enum_low = date_low = None
+        if volume is not None and self._enum_starts:
+            number = volume if isinstance(volume, int) else _number(volume)
+            if number is None:
+                return False
+            if issue is None:
+                enum_low = _pack(number, 0)
+                enum_high = enum_low | _ISSUE_MAX
+            else:
+                enum_low = enum_high = _pack(number, _number(issue) or 0)
+            index = bisect_right(self._enum_starts, enum_high) - 1
+            if index < 0 or self._enum_ends[index] < enum_low:
+                return False
+        if date is not None and self._date_starts:
+            if isinstance(date, int):
+                date_low = _year_ordinal(date)
+                date_high = _year_ordinal(date + 1) - 1
+            else:
+                date_low = date_high = date.toordinal()
+            index = bisect_right(self._date_starts, date_high) - 1
+            if index < 0 or self._date_ends[index] < date_low:
+                return False
+        if enum_low is None or date_low is None:
+            return enum_low is not None or date_low is not None
+        return not self._pairs[0] or _pair_covers(
+            self._pairs, enum_low, enum_high, date_low, date_high
+        )
+
+
+class ResolverRegistry(object):
+    """Least-recently-used store of compiled resolvers.
+
+    Resolvers are evicted oldest-first once either limit is exceeded. Access
+    is serialized with a lock, so a registry can be shared between threads.
+
+    Args:
+        maxsize (Optional[int]): maximum number of resolvers kept
+        max_bytes (Optional[int]): maximum total :attr:`Resolver.nbytes`
+
+    """
+
+    def __init__(self, maxsize=None, max_bytes=None):
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self._resolvers = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._resolvers)
+
+    def __contains__(self, key):
+        return key in self._resolvers
+
+    def add(self, key, statements):
+        """Compile and store a resolver for a title.
+
+        Args:
+            key (Hashable): identifier of the title
+            statements (Union[str, Iterable[str]]): textual holdings
+
+        Returns:
+            Resolver: the compiled resolver
+        """
+        resolver = Resolver(statements)
+        with self._lock:
+            old = self._resolvers.pop(key, None)
+            if old is not None:
+                self.nbytes -= old.nbytes
+            self._resolvers[key] = resolver
+            self.nbytes += resolver.nbytes
+            while self._resolvers and (
+                (self.maxsize is not None and len(self._resolvers) > self.maxsize)
+                or (self.max_bytes is not None and self.nbytes > self.max_bytes)
+            ):
+                _, evicted = self._resolvers.popitem(last=False)
+                self.nbytes -= evicted.nbytes
+        return resolver
+
+    def get(self, key):
+        """Look up the resolver for a title.
+
+        Args:
+            key (Hashable): identifier of the title
+
+        Returns:
+            Optional[Resolver]: the resolver, or None if it is not stored
+        """
+        with self._lock:
+            resolver = self._resolvers.get(key)
+            if resolver is not None:
+                self._resolvers.move_to_end(key)
+        return resolver
+
+    def covers(self, key, volume=None, issue=None, date=None):
+        """Check a citation against a stored title; see :meth:`Resolver.covers`.
+
+        Returns:
+            bool: False if the title is not stored or does not cover the citation
+        """
+        resolver = self.get(key)
+        return resolver is not None and resolver.covers(volume, issue, date)
+
+
+def _year_ordinal(year):
+    """Ordinal of January 1 of a year, as date(year, 1, 1).toordinal()."""
+    year -= 1
+    return year * 365 + year // 4 - year // 100 + year // 400 + 1
+
+
+def _number(value):
+    """Number of a volume or issue given as an int or text."""
+    if isinstance(value, int):
+        return value
+    return leading_number(split_enum(str(value).strip()).enumeration)
+
+
+def _pack(volume, issue):
+    """Pack a volume and issue number into one integer."""
+    return min(volume, _ISSUE_MAX) << _ISSUE_BITS | min(issue, _ISSUE_MAX)
+
+
+def _enum_range(holding):
+    """Packed (volume, issue) range of a holding, or None if unnumbered."""
+    start_volume = _number(holding.start_volume or "")
+    if start_volume is None:
+        return None
+    start = _pack(start_volume, _number(holding.start_issue or "") or 0)
+    if not (holding.end_volume or holding.end_issue):
+        return start, _ENUM_OPEN
+    end_volume = _number(holding.end_volume or "")
+    if end_volume is None:
+        end_volume = start_volume
+    end_issue = _number(holding.end_issue or "")
+    if end_issue is None:
+        end_issue = _ISSUE_MAX
+    return start, _pack(end_volume, end_issue)
+
+
+def _compile(ranges, typecode):
+    """Merge ranges into sorted arrays of disjoint starts and ends."""
+    starts = array(typecode)
+    ends = array(typecode)
+    for start, end in sorted(ranges):
+        if ends and start <= ends[-1] + 1:
+            if end > ends[-1]:
+                ends[-1] = end
+        else:
+            starts.append(start)
+            ends.append(end)
+    return starts, ends
+
+
+def _compile_pairs(pairs):
+    """Arrays of (enumeration, date) range pairs, sorted by enumeration.
+
+    Besides the starts and ends of both ranges, the arrays hold the furthest
+    enumeration end reached up to each pair, which bounds the search.
+    """
+    enum_starts, enum_ends, reach = array("Q"), array("Q"), array("Q")
+    date_starts, date_ends = array("q"), array("q")
+    for (enum_start, enum_end), (date_start, date_end) in sorted(pairs):
+        enum_starts.append(enum_start)
+        enum_ends.append(enum_end)
+        reach.append(max(enum_end, reach[-1]) if reach else enum_end)
+        date_starts.append(date_start)
+        date_ends.append(date_end)
+    return enum_starts, enum_ends, reach, date_starts, date_ends
+
+
+def _pair_covers(pairs, enum_low, enum_high, date_low, date_high):
+    """Whether one pair overlaps both [enum_low, enum_high] and the dates."""
+    enum_starts, enum_ends, reach, date_starts, date_ends = pairs
+    index = bisect_right(enum_starts, enum_high) - 1
+    while index >= 0 and reach[index] >= enum_low:
+        if (
+            enum_ends[index] >= enum_low
+            and date_starts[index] <= date_high
+            and date_ends[index] >= date_low
+        ):
+            return True
+        index -= 1
+    return False
@@ -0,0 +1,85 @@
+"""Random holdings statements for the fuzz tests and benchmarks"""
+
+from marcholdings.constants import MONTHS
+
+SEED = 7112
+ALPHABET = "v.no:()-,;/ 0123456789JanFebSept.fallspring"
+
+
+def random_garbage(rng, max_length=40):
+    """Random text built from characters that appear in holdings."""
+    return "".join(rng.choice(ALPHABET) for _ in range(rng.randint(0, max_length)))
+
+
+def random_holding(rng):
+    """A random canonical non-gap holding, as Holding.__str__ writes it."""
+    start_volume = rng.randint(1, 200)
+    end_volume = start_volume + rng.randint(0, 20)
+    start_year = rng.randint(1800, 2020)
+    end_year = start_year + end_volume - start_volume
+    enum = "v.%d" % start_volume
+    if end_volume != start_volume:
+        enum += "-%d" % end_volume
+    if rng.random() < 0.5:
+        start_month = rng.randint(2, 12)
+        enum = "v.%d:no.%d" % (start_volume, start_month)
+        if end_volume != start_volume:
+            end_month = rng.randint(1, 11)
+            enum += "-v.%d:no.%d" % (end_volume, end_month)
+            chron = "%d:%s-%d:%s" % (
+                start_year,
+                MONTHS[start_month],
+                end_year,
+                MONTHS[end_month],
+            )
+        else:
+            chron = "%d:%s" % (start_year, MONTHS[start_month])
+    elif end_year != start_year:
+        chron = "%d-%d" % (start_year, end_year)
+    else:
+        chron = str(start_year)
+    choice = rng.random()
+    if choice < 0.2:
+        return enum
+    if choice < 0.3:
+        return chron
+    return "%s(%s)" % (enum, chron)
+
+
+def random_gap_statement(rng):
+    """A random statement with gaps, e.g. "v.1,3-4(1990,1992-1993)"."""
+    enums = []
+    chrons = []
+    volume = 0
+    for _ in range(rng.randint(1, 30)):
+        volume += rng.randint(1, 5)
+        length = rng.randint(0, 3)
+        year = 1900 + volume
+        if length:
+            enums.append("%d-%d" % (volume, volume + length))
+            chrons.append("%d-%d" % (year, year + length))
+        else:
+            enums.append(str(volume))
+            chrons.append(str(year))
+        volume += length
+    separator = rng.choice(",;")
+    statement = "v.%s(%s)" % (separator.join(enums), separator.join(chrons))
+    # only a last part without an end of its own can be left open
+    if not length and rng.random() < 0.5:
+        statement += "-"
+    return statement
+
+
+def mutate(rng, statement, edits=3):
+    """A statement with a few characters inserted, deleted or replaced."""
+    chars = list(statement)
+    for _ in range(rng.randint(1, edits)):
+        position = rng.randint(0, len(chars))
+        choice = rng.random()
+        if choice < 0.4 or position == len(chars):
+            chars.insert(position, rng.choice(ALPHABET))
+        elif choice < 0.7:
+            del chars[position]
+        else:
+            chars[position] = rng.choice(ALPHABET)
+    return "".join(chars)
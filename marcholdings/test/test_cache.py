@@ -0,0 +1,75 @@
+import subprocess
+import sys
+
+import pytest
+
+from marcholdings import parse_holdings
+from marcholdings.cache import HoldingsCache
+from marcholdings.helpers import caption_table
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = HoldingsCache(str(tmp_path / "holdings.db"))
+    yield cache
+    cache.close()
+
+
+@pytest.mark.parametrize(
+    ["statement"],
+    [
+        ("v.1(2010)-",),
+        ("v.2:no.3-v.6:no.5(2002:Mar.-2006:May)",),
+        ("v.1,3(1999,2001)",),
+        ("1990-",),
+        ("v.1-7",),
+    ],
+)
+def test_roundtrip(cache, statement):
+    cache.set(statement, parse_holdings(statement))
+    cached = cache.get(statement)
+    assert cached == parse_holdings(statement)
+
+
+def test_miss(cache):
+    assert cache.get("v.1") is None
+
+
+def test_parse_many_fills_cache(cache):
+    results = cache.parse_many(["v.1", "v.2(1990)"])
+    assert [len(r) for r in results] == [1, 1]
+    assert cache.get("v.2(1990)")[0].start_volume == "2"
+
+
+def test_version_invalidates(tmp_path):
+    path = str(tmp_path / "holdings.db")
+    old = HoldingsCache(path, version="0.0.1")
+    old.parse_holdings("v.1")
+    new = HoldingsCache(path, version="0.0.2")
+    assert new.get("v.1") is None
+    assert new.prune() == 1
+    assert old.get("v.1") is None
+    old.close()
+    new.close()
+
+
+def test_captions_keep_separate_entries(tmp_path):
+    path = str(tmp_path / "holdings.db")
+    plain = HoldingsCache(path)
+    lfg = HoldingsCache(path, captions=caption_table(["Lfg"]))
+    assert plain.parse_holdings("Lfg3")[0].start_volume == "Lfg3"
+    assert lfg.parse_holdings("Lfg3")[0].start_volume == "3"
+    assert plain.get("Lfg3")[0].start_volume == "Lfg3"
+    plain.close()
+    lfg.close()
+
+
+def test_rollback_journal_by_default(cache):
+    mode = cache._connection().execute("PRAGMA journal_mode").fetchone()[0]
+    assert mode == "delete"
+
+
+def test_sqlite3_imported_lazily():
+    code = "import sys, marcholdings; print('sqlite3' in sys.modules)"
+    output = subprocess.check_output([sys.executable, "-c", code])
+    assert output.strip() == b"False"
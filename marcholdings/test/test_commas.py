@@ -65,3 +65,39 @@ class TestDateParsingFunctional(unittest.TestCase):
         self.assertEqual(holdings[1].start_date, datetime.date(2001, 1, 1))
         self.assertEqual(holdings[1].end_date, datetime.date(2001, 12, 31))
         self.assertEqual(len(holdings), 2)
+
+    def test_caption_after_comma(self):
+        holdings = parse_holdings("v.1,v.3")
+        self.assertEqual([h.start_volume for h in holdings], ["1", "3"])
+
+    def test_open_after_gap(self):
+        holdings = parse_holdings("v.1,3(1990,1992)-")
+        self.assertEqual(holdings[1].start_date, datetime.date(1992, 1, 1))
+        self.assertIsNone(holdings[1].end_date)
+        self.assertEqual(str(holdings[1]), "v.3(1992)-")
+
+    def test_open_without_closing_parenthesis(self):
+        holdings = parse_holdings("v.1-3,6(1901-1903,1906-")
+        self.assertEqual(str(holdings[1]), "v.6(1906)-")
+
+    def test_closed_range_before_open_end(self):
+        with self.assertRaises(ValueError):
+            parse_holdings("v.1,3-4(1990,1992-1993)-")
+
+    def test_missing_chronology(self):
+        with self.assertRaises(ValueError):
+            parse_holdings("v.1,3,5(1990)")
+
+    def test_extra_chronology(self):
+        with self.assertRaises(ValueError):
+            parse_holdings("v.1,3(1990,1992,1994)")
+
+    def test_bad_season(self):
+        with self.assertRaises(ValueError):
+            parse_holdings("1990:Fog")
+
+    def test_parts_with_own_chronology(self):
+        holdings = parse_holdings("v.1-10(1970-1979); v.12-15(1981-1984)")
+        self.assertEqual(len(holdings), 2)
+        self.assertEqual(holdings[1].start_volume, "12")
+        self.assertEqual(holdings[1].end_date, datetime.date(1984, 12, 31))
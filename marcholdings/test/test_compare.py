@@ -0,0 +1,43 @@
+import bisect
+import unittest
+
+from marcholdings import Holding, parse_holdings
+
+
+class TestComparison(unittest.TestCase):
+    def test_equal(self):
+        self.assertEqual(Holding.from_text("v.1(1990)"), Holding.from_text("v.1(1990)"))
+
+    def test_not_equal_to_other_types(self):
+        self.assertNotEqual(Holding.from_text("v.1"), "v.1")
+
+    def test_sort_by_date(self):
+        holdings = parse_holdings("v.3,1,2(1992,1990,1991)")
+        self.assertEqual([h.start_volume for h in sorted(holdings)], ["1", "2", "3"])
+
+    def test_numeric_enumeration_order(self):
+        holdings = [Holding.from_text("v.10"), Holding.from_text("v.9")]
+        self.assertEqual([h.start_volume for h in sorted(holdings)], ["9", "10"])
+
+    def test_open_end_sorts_last(self):
+        closed = Holding.from_text("v.1(1990)")
+        open_ended = Holding.from_text("v.1(1990)-")
+        self.assertLess(closed, open_ended)
+
+    def test_set_deduplicates(self):
+        holdings = parse_holdings("v.1,1,2(1990,1990,1991)")
+        self.assertEqual(len(set(holdings)), 2)
+
+    def test_bisect(self):
+        holdings = sorted(parse_holdings("1990,1992,1994"))
+        index = bisect.bisect(holdings, Holding.from_text("1993"))
+        self.assertEqual(index, 2)
+
+    def test_equal_only_if_printed_the_same(self):
+        self.assertNotEqual(Holding.from_text("v.01"), Holding.from_text("v.1"))
+        self.assertNotEqual(Holding.from_text("v.1A"), Holding.from_text("v.1a"))
+        self.assertEqual(len({Holding.from_text("v.01"), Holding.from_text("v.1")}), 2)
+
+    def test_normalized_order(self):
+        holdings = [Holding.from_text(t) for t in ("v.2", "v.01", "v.1")]
+        self.assertEqual([h.start_volume for h in sorted(holdings)], ["01", "1", "2"])
@@ -0,0 +1,99 @@
+import random
+import time
+
+import pytest
+
+from marcholdings import Holding, normalize_holdings, parse_holdings
+from marcholdings.test.generators import (
+    SEED,
+    random_gap_statement,
+    random_garbage,
+    random_holding,
+)
+
+
+def adversarial_statements(size):
+    """Statements built to stress the splitting loops."""
+    gaps = ",".join(str(i) for i in range(1, size))
+    years = ",".join(str(1000 + i % 1000) for i in range(1, size))
+    return [
+        "v.%s(%s)" % (gaps, years),
+        "v.%s(%s)-" % (gaps, years),
+        "(" * size,
+        ")" * size,
+        "v.1(" * size,
+        "," * size,
+        ";" * size + "1990",
+        "-" * size,
+        ":" * size,
+        "v.1:" + ":".join("no.1" for _ in range(size)),
+        "1990:" + ",".join("Jan." for _ in range(size)),
+        "v." + "1" * size,
+        "v.%s(1990)" % gaps,
+        "v.1(%s)" % years,
+    ]
+
+
+def parse_or_reject(statement):
+    """Parse a statement, treating ValueError as a clean rejection."""
+    try:
+        return parse_holdings(statement)
+    except ValueError:
+        return None
+
+
+def best_time(statement, repeat=3):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        parse_or_reject(statement)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def test_garbage_only_raises_value_error():
+    rng = random.Random(SEED)
+    for _ in range(5000):
+        parse_or_reject(random_garbage(rng))
+
+
+@pytest.mark.parametrize("statement", adversarial_statements(5000))
+def test_adversarial_parse_time_bounded(statement):
+    start = time.perf_counter()
+    parse_or_reject(statement)
+    assert time.perf_counter() - start < 2.0
+
+
+@pytest.mark.parametrize(
+    "index", range(len(adversarial_statements(2))), ids=lambda i: "pattern%d" % i
+)
+def test_parse_time_linear(index):
+    small = best_time(adversarial_statements(2000)[index])
+    large = best_time(adversarial_statements(16000)[index])
+    # 8x the input should cost about 8x the time; allow for timer noise
+    assert large < max(small, 1e-4) * 8 * 4
+
+
+def test_canonical_roundtrip():
+    rng = random.Random(SEED)
+    for _ in range(2000):
+        statement = random_holding(rng)
+        assert str(Holding.from_text(statement)) == statement
+
+
+def test_roundtrip_gap_statements():
+    rng = random.Random(SEED)
+    for _ in range(1000):
+        for holding in parse_holdings(random_gap_statement(rng)):
+            assert Holding.from_text(str(holding)) == holding
+
+
+@pytest.mark.parametrize("statement", ["v.1:.2", "v.1 ,3", "v.1::2,3"])
+def test_roundtrip_empty_tokens(statement):
+    holdings = parse_holdings(statement)
+    for holding in holdings:
+        assert Holding.from_text(str(holding)) == holding
+    normalized = normalize_holdings(statement)
+    assert parse_holdings(normalized) == holdings
+    assert normalize_holdings(normalized) == normalized
@@ -0,0 +1,71 @@
+import datetime
+import unittest
+
+from marcholdings import parse_holdings
+from marcholdings.gaps import PublicationPattern, find_gaps
+
+MONTHLY = PublicationPattern(frequency=12, start_year=1990, issues_per_volume=12)
+
+
+class TestGaps(unittest.TestCase):
+    def gaps(self, statement, pattern=MONTHLY, end_year=1996):
+        return [str(g) for g in find_gaps(parse_holdings(statement), pattern, end_year)]
+
+    def test_complete_run(self):
+        self.assertEqual(self.gaps("v.1(1990)-"), [])
+
+    def test_whole_volume_missing(self):
+        self.assertEqual(self.gaps("v.1-2,4-7"), ["v.3(1992)"])
+
+    def test_partial_volumes(self):
+        self.assertEqual(
+            self.gaps("v.2:no.3-v.7:no.10"),
+            ["v.1:no.1-v.2:no.2(1990-1991:Feb.)", "v.7:no.11-12(1996:Nov.-Dec.)"],
+        )
+
+    def test_single_issue(self):
+        holdings = parse_holdings("v.1:no.1-5") + parse_holdings("v.1:no.7-v.7:no.12")
+        gaps = find_gaps(holdings, MONTHLY, 1996)
+        self.assertEqual([str(g) for g in gaps], ["v.1:no.6(1990:June)"])
+
+    def test_by_date(self):
+        self.assertEqual(
+            self.gaps("1990-1992:June,1994:Feb.-"),
+            ["v.3:no.7-v.5:no.1(1992:July-1994:Jan.)"],
+        )
+
+    def test_start_volume(self):
+        pattern = MONTHLY._replace(start_volume=10)
+        self.assertEqual(self.gaps("v.10-11,13-16", pattern), ["v.12(1992)"])
+
+    def test_daily_long_run(self):
+        pattern = PublicationPattern(frequency=365, start_year=1900)
+        gaps = find_gaps(parse_holdings("1900-1950,1952-"), pattern, 2020)
+        self.assertEqual(len(gaps), 1)
+        self.assertEqual(gaps[0].start_date, datetime.date(1951, 1, 1))
+        self.assertEqual(gaps[0].end_date, datetime.date(1951, 12, 31))
+        self.assertEqual(str(gaps[0]), "1951")
+
+    def test_weekly_dates(self):
+        pattern = PublicationPattern(frequency=52, start_year=2000)
+        gaps = find_gaps(parse_holdings("2000:Jan.-2000:June"), pattern, 2000)
+        # the week containing June 30 runs through July 1
+        self.assertEqual(gaps[0].start_date, datetime.date(2000, 7, 2))
+        self.assertEqual(gaps[0].end_date, datetime.date(2000, 12, 31))
+
+    def test_daily_gap_days(self):
+        pattern = PublicationPattern(frequency=365, start_year=2000)
+        self.assertEqual(
+            self.gaps("2000:Mar. 5-2000:Dec. 31", pattern, 2000), ["2000:Jan.-Mar. 4"]
+        )
+
+    def test_weekly_gap_days(self):
+        pattern = PublicationPattern(frequency=52, start_year=2000)
+        self.assertEqual(
+            self.gaps("2000:Jan.-2000:June", pattern, 2000), ["2000:July 2-Dec."]
+        )
+
+    def test_volume_without_volume_pattern(self):
+        pattern = PublicationPattern(frequency=12, start_year=1990)
+        with self.assertRaises(ValueError):
+            find_gaps(parse_holdings("v.1-5"), pattern, 1991)
@@ -0,0 +1,74 @@
+from unittest import mock
+
+import pytest
+
+from marcholdings import helpers
+
+from marcholdings.holding import normalize_holdings, normalize_many, parse_holdings
+
+
+@pytest.mark.parametrize(
+    ["statement", "normalized"],
+    [
+        ("v.1(2010)-", "v.1(2010)-"),
+        ("v.1,3(1999,2001)", "v.1(1999),v.3(2001)"),
+        ("v.1;3(1999;2001)", "v.1(1999);v.3(2001)"),
+        ("1999,2001", "1999,2001"),
+        ("v.1-10(1970-1979); v.12(1981)-", "v.1-10(1970-1979);v.12(1981)-"),
+        ("v.1,2(1990,1991);v.5(1995)-", "v.1(1990),v.2(1991);v.5(1995)-"),
+        (
+            "v.2:no.3-v.6:no.5(2002:Mar.-2006:May",
+            "v.2:no.3-v.6:no.5(2002:Mar.-2006:May)",
+        ),
+        ("v.1:.2", "v.1:no..2"),
+        ("v.1 ,3", "v.1,v.3"),
+        ("v.1::2,3", "v.1:no.:2,v.3"),
+        ("", ""),
+    ],
+)
+def test_normalize(statement, normalized):
+    assert normalize_holdings(statement) == normalized
+
+
+@pytest.mark.parametrize(
+    ["statement"],
+    [
+        ("v.1,3(1999,2001)",),
+        ("v.1-10(1970-1979);v.12-15(1981-1984)",),
+        ("v.1:.2",),
+        ("v.1 ,3",),
+        ("v.1::2,3",),
+    ],
+)
+def test_normalize_idempotent(statement):
+    normalized = normalize_holdings(statement)
+    assert normalize_holdings(normalized) == normalized
+
+
+def test_normalized_parses_the_same():
+    statement = "v.1,3(1999,2001)"
+    before = parse_holdings(statement)
+    after = parse_holdings(normalize_holdings(statement))
+    assert before == after
+
+
+def test_normalize_many():
+    statements = ["v.1,3(1999,2001)", "1990-", "v.1,3(1999,2001)"]
+    assert list(normalize_many(statements)) == [
+        "v.1(1999),v.3(2001)",
+        "1990-",
+        "v.1(1999),v.3(2001)",
+    ]
+
+
+def test_normalize_after_register_caption():
+    assert normalize_holdings("Lfg3") == "v.Lfg3"
+    with mock.patch.object(helpers, "_caption_table", helpers._caption_table):
+        helpers.register_caption("Lfg")
+        assert normalize_holdings("Lfg3") == "v.3"
+    assert normalize_holdings("Lfg3") == "v.Lfg3"
+
+
+def test_normalize_captions():
+    captions = helpers.caption_table(["Lfg"])
+    assert normalize_holdings("Lfg3", captions) == "v.3"
@@ -0,0 +1,65 @@
+from concurrent.futures import ThreadPoolExecutor
+import gc
+import random
+import threading
+
+from marcholdings import helpers, parse_holdings
+from marcholdings.parser import Parser
+from marcholdings.test.generators import SEED, random_gap_statement
+
+
+def test_parse_matches_parse_holdings():
+    parser = Parser()
+    statement = "v.1,3(1999,2001)"
+    assert parser.parse_holdings(statement) == parse_holdings(statement)
+    assert parser.parse_holdings(statement) == parse_holdings(statement)
+    assert parser.stats() == {"hits": 1, "misses": 1, "cached": 1, "threads": 1}
+
+
+def test_maxsize():
+    parser = Parser(maxsize=2)
+    parser.parse_many(["v.1", "v.2", "v.3"])
+    assert parser.stats()["cached"] == 1
+
+
+def test_clear():
+    parser = Parser()
+    parser.parse_many(["v.1", "v.1"])
+    parser.clear()
+    assert parser.stats()["hits"] == 0
+    parser.parse_holdings("v.1")
+    assert parser.stats()["misses"] == 1
+
+
+def test_threads():
+    rng = random.Random(SEED)
+    statements = [random_gap_statement(rng) for _ in range(200)]
+    expected = [parse_holdings(statement) for statement in statements]
+    parser = Parser()
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(parser.parse_many, [statements] * 16))
+    assert all(result == expected for result in results)
+    stats = parser.stats()
+    assert stats["hits"] + stats["misses"] == 16 * 200
+    assert stats["threads"] <= 8
+
+
+def test_exited_threads_drop_shards():
+    parser = Parser()
+    for _ in range(50):
+        thread = threading.Thread(target=parser.parse_many, args=(["v.1", "v.1"],))
+        thread.start()
+        thread.join()
+    gc.collect()
+    assert parser.stats() == {"hits": 50, "misses": 50, "cached": 0, "threads": 0}
+
+
+def test_register_caption():
+    parser = Parser(captions=["Lfg"])
+    parser.parse_holdings("Lief3")
+    parser.register_caption("Lief")
+    assert parser.stats()["misses"] == 0
+    assert parser.parse_holdings("Lfg3")[0].start_volume == "3"
+    assert parser.parse_holdings("Lief3")[0].start_volume == "3"
+    assert parse_holdings("Lief3")[0].start_volume == "Lief3"
+    assert "lfg" not in helpers._caption_table
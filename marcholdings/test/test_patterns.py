@@ -0,0 +1,84 @@
+import datetime
+import unittest
+
+from marcholdings import Holding
+from marcholdings.patterns import CaptionPattern, decode_record, decode_records
+
+PATTERN = [("8", "1"), ("a", "v."), ("b", "no."), ("i", "(year)"), ("j", "(month)")]
+
+
+class TestDecode(unittest.TestCase):
+    def setUp(self):
+        self.pattern = CaptionPattern.from_subfields(PATTERN)
+
+    def assertSameAsText(self, subfields, text):
+        holding = self.pattern.decode(subfields)
+        self.assertEqual(holding, Holding.from_text(text))
+
+    def test_compile(self):
+        self.assertEqual(self.pattern.link, "1")
+        self.assertEqual(
+            [level.kind for level in self.pattern.levels],
+            ["volume", "issue", "year", "month"],
+        )
+
+    def test_range(self):
+        self.assertSameAsText(
+            [
+                ("8", "1.1"),
+                ("a", "2-6"),
+                ("b", "3-5"),
+                ("i", "2002-2006"),
+                ("j", "03-05"),
+            ],
+            "v.2:no.3-v.6:no.5(2002:Mar.-2006:May)",
+        )
+
+    def test_single_volume(self):
+        self.assertSameAsText([("8", "1.1"), ("a", "1"), ("i", "1990")], "v.1(1990)")
+
+    def test_issues_within_volume(self):
+        self.assertSameAsText([("8", "1.1"), ("a", "1"), ("b", "1-3")], "v.1:no.1-3")
+
+    def test_open(self):
+        self.assertSameAsText([("8", "1.1"), ("a", "1-"), ("i", "2010-")], "v.1(2010)-")
+
+    def test_open_partial(self):
+        self.assertSameAsText(
+            [("8", "1.1"), ("a", "1-"), ("b", "2-"), ("i", "1990-"), ("j", "02-")],
+            "v.1:no.2(1990:Feb.)-",
+        )
+
+    def test_seasons(self):
+        pattern = CaptionPattern.from_subfields(
+            [("8", "2"), ("a", "v."), ("i", "(year)"), ("j", "(season)")]
+        )
+        holding = pattern.decode(
+            [("8", "2.1"), ("a", "1-2"), ("i", "1990-2000"), ("j", "23-21")]
+        )
+        self.assertEqual(holding.start_date, datetime.date(1990, 9, 1))
+        self.assertEqual(holding.end_date, datetime.date(2000, 6, 30))
+
+    def test_chronology_as_enumeration(self):
+        pattern = CaptionPattern.from_subfields([("8", "3"), ("a", "(year)")])
+        holding = pattern.decode([("8", "3.1"), ("a", "1998-2006")])
+        self.assertEqual(holding, Holding.from_text("(1998-2006)"))
+
+
+class TestDecodeRecord(unittest.TestCase):
+    def test_links(self):
+        record = [
+            ("001", []),
+            ("853", PATTERN),
+            ("853", [("8", "2"), ("a", "bd.")]),
+            ("863", [("8", "2.1"), ("a", "7")]),
+            ("863", [("8", "1.2"), ("a", "3"), ("i", "1992")]),
+            ("863", [("8", "1.1"), ("a", "1"), ("i", "1990")]),
+            ("863", [("8", "9.1"), ("a", "1")]),
+        ]
+        holdings = decode_record(record)
+        self.assertEqual([h.start_volume for h in holdings], ["1", "3", "7"])
+
+    def test_records(self):
+        record = [("853", PATTERN), ("863", [("8", "1.1"), ("a", "1")])]
+        self.assertEqual([len(r) for r in decode_records([record, []])], [1, 0])
@@ -0,0 +1,93 @@
+from array import array
+import datetime
+import sys
+import unittest
+
+from marcholdings.resolver import Resolver, ResolverRegistry
+
+
+class TestResolver(unittest.TestCase):
+    def setUp(self):
+        self.resolver = Resolver("v.2:no.3-v.6:no.5(2002:Mar.-2006:May)")
+
+    def test_issue_inside(self):
+        self.assertTrue(self.resolver.covers(volume=4, issue=1))
+
+    def test_issue_before_start(self):
+        self.assertFalse(self.resolver.covers(volume=2, issue=2))
+
+    def test_issue_after_end(self):
+        self.assertFalse(self.resolver.covers(volume="6", issue="6"))
+
+    def test_partial_volume(self):
+        self.assertTrue(self.resolver.covers(volume=2))
+
+    def test_date(self):
+        self.assertTrue(self.resolver.covers(date=datetime.date(2006, 5, 31)))
+        self.assertFalse(self.resolver.covers(date=datetime.date(2006, 6, 1)))
+
+    def test_year(self):
+        self.assertTrue(self.resolver.covers(date=2002))
+        self.assertFalse(self.resolver.covers(date=2001))
+
+    def test_all_axes(self):
+        self.assertTrue(self.resolver.covers(volume=5, issue=1, date=2005))
+        self.assertFalse(self.resolver.covers(volume=5, issue=1, date=2007))
+
+    def test_gaps(self):
+        resolver = Resolver("v.1,3(1999,2001)")
+        self.assertTrue(resolver.covers(volume=3))
+        self.assertFalse(resolver.covers(volume=2))
+        self.assertFalse(resolver.covers(date=2000))
+
+    def test_axes_from_same_holding(self):
+        resolver = Resolver("v.1,3(1999,2001)")
+        self.assertFalse(resolver.covers(volume=3, date=1999))
+        self.assertTrue(resolver.covers(volume=3, date=2001))
+
+    def test_axes_from_separate_statements(self):
+        resolver = Resolver(["v.1-5", "1990-1995"])
+        self.assertTrue(resolver.covers(volume=3, date=1992))
+
+    def test_nbytes(self):
+        resolver = Resolver("v.1(1990)")
+        arrays = 4 * sys.getsizeof(array("q"))
+        self.assertGreater(resolver.nbytes, sys.getsizeof(resolver) + arrays)
+
+    def test_open_ended(self):
+        resolver = Resolver(["v.1(2010)-"])
+        self.assertTrue(resolver.covers(volume=99, date=2099))
+
+    def test_dates_only(self):
+        resolver = Resolver("1990-1995")
+        self.assertTrue(resolver.covers(volume=12, date=1992))
+        self.assertFalse(resolver.covers(volume=12))
+
+    def test_caption_in_citation(self):
+        self.assertTrue(self.resolver.covers(volume="v.3", issue="no.2"))
+
+
+class TestRegistry(unittest.TestCase):
+    def test_lru_eviction(self):
+        registry = ResolverRegistry(maxsize=2)
+        registry.add("a", "v.1")
+        registry.add("b", "v.2")
+        registry.get("a")
+        registry.add("c", "v.3")
+        self.assertIn("a", registry)
+        self.assertNotIn("b", registry)
+        self.assertEqual(len(registry), 2)
+
+    def test_memory_limit(self):
+        resolver = ResolverRegistry().add("a", "v.1(1990)")
+        registry = ResolverRegistry(max_bytes=resolver.nbytes * 2)
+        for key in "abc":
+            registry.add(key, "v.1(1990)")
+        self.assertEqual(len(registry), 2)
+        self.assertEqual(registry.nbytes, resolver.nbytes * 2)
+
+    def test_covers(self):
+        registry = ResolverRegistry()
+        registry.add("a", "v.1-5")
+        self.assertTrue(registry.covers("a", volume=3))
+        self.assertFalse(registry.covers("b", volume=3))
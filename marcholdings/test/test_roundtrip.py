@@ -13,6 +13,9 @@ import marcholdings
         ("v.2:no.3-v.6:no.5(2002:Mar.-2006:May)",),
         ("v.1",),
         ("v.1:no.2(2016:Feb.)-",),
+        ("v.1:no.2",),
+        ("v.1:no.2-4(1990:Feb.-Apr.)",),
+        ("1990:Feb.-Apr.",),
     ],
 )
 def test_string_roundtrip(holding):
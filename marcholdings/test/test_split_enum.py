@@ -1,6 +1,13 @@
 import unittest
+from unittest import mock
 
-from marcholdings.helpers import split_enum
+from marcholdings import helpers
+from marcholdings.helpers import (
+    caption_table,
+    register_caption,
+    split_enum,
+    trim_ordinal,
+)
 
 
 class TestCaptions(unittest.TestCase):
@@ -27,3 +34,57 @@ class TestCaptions(unittest.TestCase):
     def test_no_caption(self):
         splitparts = split_enum("2")
         self.assertEqual(splitparts.enumeration, "2")
+
+    def test_known_caption_with_space(self):
+        splitparts = split_enum("bd. 12")
+        self.assertEqual(splitparts.caption, "bd.")
+        self.assertEqual(splitparts.enumeration, "12")
+
+    def test_known_word_caption(self):
+        splitparts = split_enum("Heft 3")
+        self.assertEqual(splitparts.caption, "Heft")
+        self.assertEqual(splitparts.enumeration, "3")
+
+    def test_known_caption_case(self):
+        splitparts = split_enum("Jahrg.5")
+        self.assertEqual(splitparts.caption, "Jahrg.")
+        self.assertEqual(splitparts.enumeration, "5")
+
+    def test_longest_caption_wins(self):
+        splitparts = split_enum("vol.2")
+        self.assertEqual(splitparts.caption, "vol.")
+        self.assertEqual(splitparts.enumeration, "2")
+
+    def test_registered_caption(self):
+        with mock.patch.object(helpers, "_caption_table", helpers._caption_table):
+            register_caption("Lfg")
+            splitparts = split_enum("Lfg 4")
+        self.assertEqual(splitparts.caption, "Lfg")
+        self.assertEqual(splitparts.enumeration, "4")
+        self.assertNotIn("lfg", helpers._caption_table)
+
+    def test_caption_table(self):
+        captions = caption_table(["Lfg"])
+        self.assertEqual(split_enum("Lfg3", captions), ("Lfg", "3"))
+        self.assertEqual(split_enum("Lfg3"), ("", "Lfg3"))
+        self.assertEqual(split_enum("v.1", captions), ("v.", "1"))
+
+    def test_bad_caption(self):
+        with self.assertRaises(ValueError):
+            register_caption("n.s.")
+
+    def test_empty(self):
+        self.assertEqual(split_enum(""), ("", ""))
+
+    def test_word_caption_prefix_only(self):
+        splitparts = split_enum("Hefte 3")
+        self.assertEqual(splitparts.caption, "Hefte")
+        self.assertEqual(splitparts.enumeration, "3")
+
+
+class TestTrimOrdinal(unittest.TestCase):
+    def test_trim(self):
+        self.assertEqual(trim_ordinal("22nd"), "22")
+
+    def test_no_suffix(self):
+        self.assertEqual(trim_ordinal("22"), "22")
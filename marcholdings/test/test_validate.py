@@ -0,0 +1,117 @@
+import random
+
+import pytest
+
+from marcholdings import parse_holdings
+from marcholdings.test.generators import (
+    SEED,
+    mutate,
+    random_gap_statement,
+    random_garbage,
+    random_holding,
+)
+from marcholdings.validate import Diagnostic, parse_valid, validate_holdings
+
+
+@pytest.mark.parametrize(
+    ["statement"],
+    [
+        ("v.1(2010)-",),
+        ("v.1:no.3,5-6(1982:May/June,Sept./Oct.-Nov./Dec.)",),
+        ("v.1,3(1990,1992)-",),
+        ("v.2:no.3-v.6:no.5(2002:Mar. 2-2006:May 6",),
+        ("1992/1996-",),
+        ("v.1-2(1990:fall-2000:spring)",),
+        ("(1998-2006)",),
+        ("v.1,3",),
+        ("bd.1-4",),
+    ],
+)
+def test_valid(statement):
+    assert validate_holdings(statement) == []
+
+
+@pytest.mark.parametrize(
+    ["statement", "diagnostic"],
+    [
+        ("", Diagnostic(0, "", "empty statement")),
+        ("1990:Fog", Diagnostic(5, "Fog", "bad month/season")),
+        ("v.1(199)", Diagnostic(4, "199", "bad year")),
+        ("v.1(1990:Mar. 40)", Diagnostic(14, "40", "bad day")),
+        ("v.1(1990-Apr.)", Diagnostic(9, "Apr.", "expected year")),
+        ("v.1(1990,)", Diagnostic(9, "", "incomplete date")),
+        ("v.1((1990)", Diagnostic(4, "(", "repeated parenthesis")),
+        ("v.1)1990(", Diagnostic(3, ")", "unmatched parenthesis")),
+        ("v.1(1990)x", Diagnostic(9, "x", "text after chronology")),
+        ("v.1,3(1990)", Diagnostic(5, "(", "more enumerations than chronologies")),
+        ("v.1,,3", Diagnostic(4, ",", "empty enumeration")),
+        ("5,0", Diagnostic(0, "5", "missing caption")),
+        (
+            "v.1,3(1990,1992-1993)-",
+            Diagnostic(11, "1992-1993", "closed range before open end"),
+        ),
+        ("v.1,3-4-", Diagnostic(4, "3-4", "closed range before open end")),
+        (
+            "v.1,3(1990,1992,1994)",
+            Diagnostic(5, "(", "more chronologies than enumerations"),
+        ),
+        ("v.1:.2", Diagnostic(4, ".", "empty element")),
+        ("v.1::2,3", Diagnostic(4, ":", "empty element")),
+        ("v.1 ,3", Diagnostic(4, ",", "empty element")),
+        (
+            "v.6:..11-v.25:no.3(1922:Nov.-1941:Mar.)",
+            Diagnostic(4, ".", "empty element"),
+        ),
+        ("v.10(1841:Mar.-)", Diagnostic(14, "-", "open end inside parentheses")),
+        ("v.2,7-(1902,1907)-", Diagnostic(5, "-", "open end before chronology")),
+    ],
+)
+def test_invalid(statement, diagnostic):
+    assert diagnostic in validate_holdings(statement)
+
+
+def test_valid_statements_parse():
+    rng = random.Random(SEED)
+    for _ in range(20000):
+        statement = random_garbage(rng)
+        if not validate_holdings(statement):
+            parse_holdings(statement)
+
+
+def test_valid_mutations_parse():
+    rng = random.Random(SEED)
+    for _ in range(20000):
+        if rng.random() < 0.5:
+            statement = mutate(rng, random_holding(rng))
+        else:
+            statement = mutate(rng, random_gap_statement(rng))
+        if not validate_holdings(statement):
+            parse_holdings(statement)
+
+
+def test_generated_statements_valid():
+    rng = random.Random(SEED)
+    for _ in range(1000):
+        assert validate_holdings(random_holding(rng)) == []
+        assert validate_holdings(random_gap_statement(rng)) == []
+
+
+def test_parse_valid():
+    rejected = []
+    results = list(parse_valid(["v.1(1990)", "1990:Fog", "v.2"], rejected))
+    assert [statement for statement, _ in results] == ["v.1(1990)", "v.2"]
+    assert rejected == [("1990:Fog", [Diagnostic(5, "Fog", "bad month/season")])]
+
+
+def test_parse_valid_catches_parser_errors():
+    rejected = []
+    assert list(parse_valid(["1990:Feb. 30"], rejected)) == []
+    statement, diagnostics = rejected[0]
+    assert statement == "1990:Feb. 30"
+    assert [d.offset for d in diagnostics] == [0]
+
+
+def test_parts_with_own_chronology():
+    assert validate_holdings("v.1-10(1970-1979); v.12(1981)-") == []
+    assert validate_holdings("v.1(1970);v.2(19)") == [Diagnostic(14, "19", "bad year")]
+    assert validate_holdings("v.1(1970),") == [Diagnostic(10, "", "empty part")]
@@ -0,0 +1,269 @@
+"""Check holdings statements before parsing them"""
+
+from collections import namedtuple
+import re
+
+from marcholdings.constants import MONTHS, SEGMENT_SPLIT
+from marcholdings.holding import parse_holdings
+
+Diagnostic = namedtuple("Diagnostic", ["offset", "token", "reason"])
+Diagnostic.__doc__ = """A problem found in a holdings statement.
+
+Args:
+    offset (int): position of the problem in the statement
+    token (str): the offending text
+    reason (str): what is wrong with it
+"""
+
+SEASONS = ("spring", "summer", "fall", "autumn", "winter")
+
+_ENUM_SEPARATOR = re.compile(r"[ .,:;]")
+_PART_SEPARATOR = re.compile(r"[,;]")
+_ENUM_TOKEN = re.compile(r"[^\W_]+\.?|[,;:\- ./]|.", re.UNICODE)
+# separators that leave an empty element when another separator follows
+_EMPTY_BEFORE = (" ", ".", ",", ":", ";")
+_CHRON_TOKEN = re.compile(r"\d+|[^\W\d_]+\.?|[,;:/ \-]|.", re.UNICODE)
+
+
+def validate_holdings(text_holdings):
+    """Check a holdings statement without parsing it.
+
+    The scan is a single pass over the text that checks the structure
+    :func:`~marcholdings.holding.parse_holdings` relies on: balanced
+    parentheses, well-formed years, months, seasons and days, no empty
+    elements between separators, open ends written after the chronology,
+    and exactly one enumeration for every chronology. Calendar checks such
+    as February 30 are left to the parser.
+
+    Args:
+        text_holdings (str): textual holdings
+
+    Returns:
+        List[Diagnostic]: problems found, empty if the statement is valid
+    """
+    if not text_holdings.strip():
+        return [Diagnostic(0, text_holdings, "empty statement")]
+    diagnostics = []
+    start = 0
+    # parts that carry their own chronology are checked one at a time
+    for match in SEGMENT_SPLIT.finditer(text_holdings):
+        _check_segment(text_holdings[start : match.start()], start, diagnostics)
+        start = match.end()
+    _check_segment(text_holdings[start:], start, diagnostics)
+    return diagnostics
+
+
+def parse_valid(statements, rejected=None):
+    """Parse the valid statements of a batch, skipping the rest.
+
+    Each statement is checked with :func:`validate_holdings` first, so most
+    invalid rows are dropped without parsing them; a ValueError from the
+    parser is reported as a single diagnostic at offset 0.
+
+    Args:
+        statements (Iterable[str]): textual holdings
+        rejected (Optional[list]): if given, (statement, diagnostics)
+            pairs are appended to it for every statement skipped
+
+    Yields:
+        Tuple[str, List[Holding]]: each valid statement and its holdings
+    """
+    for statement in statements:
+        diagnostics = validate_holdings(statement)
+        if not diagnostics:
+            try:
+                yield statement, parse_holdings(statement)
+                continue
+            except ValueError as exc:
+                diagnostics = [Diagnostic(0, statement, str(exc))]
+        if rejected is not None:
+            rejected.append((statement, diagnostics))
+
+
+def _check_segment(text, offset, diagnostics):
+    """Check a statement, or one part of it with its own chronology."""
+    if not text.strip():
+        diagnostics.append(Diagnostic(offset, text, "empty part"))
+        return
+    opening = text.find("(")
+    closing = text.find(")")
+    if opening == -1:
+        if closing != -1:
+            diagnostics.append(
+                Diagnostic(offset + closing, ")", "unmatched parenthesis")
+            )
+        elif text[0:4].isdigit():
+            _check_chronology(text, offset, diagnostics)
+        else:
+            _check_enumeration(text, offset, diagnostics, captioned=True)
+        _check_open_ends(text, offset, diagnostics)
+        return
+
+    second = text.find("(", opening + 1)
+    if second != -1:
+        diagnostics.append(Diagnostic(offset + second, "(", "repeated parenthesis"))
+        return
+    if -1 < closing < opening:
+        diagnostics.append(Diagnostic(offset + closing, ")", "unmatched parenthesis"))
+        return
+    end = len(text) if closing == -1 else closing
+    if closing != -1:
+        trailing = text[closing + 1 :]
+        if trailing not in ("", "-"):
+            diagnostics.append(
+                Diagnostic(offset + closing + 1, trailing, "text after chronology")
+            )
+        if text[closing - 1] == "-":
+            # an open end is written after the chronology: "v.1(1990)-"
+            diagnostics.append(
+                Diagnostic(offset + closing - 1, "-", "open end inside parentheses")
+            )
+    if text[opening - 1 : opening] == "-":
+        diagnostics.append(
+            Diagnostic(offset + opening - 1, "-", "open end before chronology")
+        )
+    enums = _check_enumeration(text[:opening], offset, diagnostics)
+    chrons = _check_chronology(
+        text[opening + 1 : end], offset + opening + 1, diagnostics
+    )
+    if enums > chrons:
+        diagnostics.append(
+            Diagnostic(offset + opening, "(", "more enumerations than chronologies")
+        )
+    elif enums < chrons:
+        diagnostics.append(
+            Diagnostic(offset + opening, "(", "more chronologies than enumerations")
+        )
+    if text.endswith("-"):
+        chronology = text[opening + 1 : end]
+        _check_open_ends(text[:opening], offset, diagnostics, last_only=True)
+        _check_open_ends(chronology, offset + opening + 1, diagnostics, last_only=True)
+
+
+def _check_open_ends(text, offset, diagnostics, last_only=False):
+    """Check that no open-ended part also gives an end of its own.
+
+    Args:
+        last_only (bool): check just the last part, which is open because
+            the whole statement ends in a dash
+    """
+    parts = _PART_SEPARATOR.split(text)
+    position = offset
+    for index, part in enumerate(parts):
+        is_last = index == len(parts) - 1
+        if (is_last if last_only else part.endswith("-")) and "-" in part.rstrip("-"):
+            diagnostics.append(
+                Diagnostic(position, part.rstrip("-"), "closed range before open end")
+            )
+        position += len(part) + 1
+
+
+def _check_enumeration(text, offset, diagnostics, captioned=False):
+    """Check the enumeration part of a statement.
+
+    Args:
+        captioned (bool): whether every enumeration needs a caption, as it
+            does when the statement has no chronology to fall back on
+
+    Returns:
+        int: number of enumerations separated by commas or semicolons
+    """
+    count = 1
+    empty = True
+    # the parser carries the first caption over when it ends in one of these
+    first = _ENUM_SEPARATOR.search(text)
+    inherited = bool(first) and first.group() not in ",;"
+    if inherited and "-" in text[: first.start()]:
+        diagnostics.append(Diagnostic(offset, text[: first.start()], "bad caption"))
+    previous = ""
+    for match in _ENUM_TOKEN.finditer(text):
+        token = match.group()
+        if token in ",;":
+            if empty:
+                diagnostics.append(
+                    Diagnostic(offset + match.start(), token, "empty enumeration")
+                )
+            elif previous in _EMPTY_BEFORE:
+                diagnostics.append(
+                    Diagnostic(offset + match.start(), token, "empty element")
+                )
+            count += 1
+            empty = True
+        elif token in ":." and previous in _EMPTY_BEFORE:
+            # "v.1::2" or "v.1:.2": nothing between the two separators
+            diagnostics.append(
+                Diagnostic(offset + match.start(), token, "empty element")
+            )
+        elif token.isalnum() or token[:-1].isalnum():
+            if captioned and empty and token[:1].isdigit() and not inherited:
+                diagnostics.append(
+                    Diagnostic(offset + match.start(), token, "missing caption")
+                )
+            empty = False
+        elif token not in ":-. /":
+            diagnostics.append(
+                Diagnostic(offset + match.start(), token, "unexpected character")
+            )
+        previous = token[-1]
+    if empty and text and not text.endswith("-"):
+        diagnostics.append(Diagnostic(offset + len(text), "", "empty enumeration"))
+    return count
+
+
+def _check_chronology(text, offset, diagnostics):
+    """Check the chronology part of a statement.
+
+    Returns:
+        int: number of chronologies separated by commas or semicolons
+    """
+    count = 1
+    state = "year"
+    has_month = False
+    token = ""
+    for match in _CHRON_TOKEN.finditer(text):
+        token = match.group()
+        position = offset + match.start()
+        if state in ("year", "element"):
+            if token.isdigit():
+                if len(token) != 4 or token == "0000":
+                    diagnostics.append(Diagnostic(position, token, "bad year"))
+                    return count
+                state = "after_year"
+                has_month = False
+            elif state == "element" and has_month and _is_month(token):
+                state = "after_month"
+            else:
+                diagnostics.append(Diagnostic(position, token, "expected year"))
+                return count
+        elif state == "month":
+            if not _is_month(token):
+                diagnostics.append(Diagnostic(position, token, "bad month/season"))
+                return count
+            state = "after_month"
+            has_month = True
+        elif state == "day":
+            if not token.isdigit() or not 1 <= int(token) <= 31:
+                diagnostics.append(Diagnostic(position, token, "bad day"))
+                return count
+            state = "after_day"
+        elif token == "/" and state in ("after_year", "after_month"):
+            state = "year" if state == "after_year" else "month"
+        elif token == ":" and state == "after_year":
+            state = "month"
+        elif token == " " and state == "after_month":
+            state = "day"
+        elif token in ",;-":
+            if token != "-":
+                count += 1
+            state = "element"
+        else:
+            diagnostics.append(Diagnostic(position, token, "unexpected character"))
+            return count
+    # a dash at the very end marks an open range
+    if state in ("year", "month", "day") or (state == "element" and token != "-"):
+        diagnostics.append(Diagnostic(offset + len(text), "", "incomplete date"))
+    return count
+
+
+def _is_month(token):
+    return token in MONTHS[1:] or token.lower() in SEASONS